@@ -1,13 +1,22 @@
+import time
 import turtle as tt
-from random import choice
+from bisect import bisect_left
+from random import choices
 from itertools import cycle
-from typing import Optional
 
 from tetrominoes import I, J, L, S, Z, O, T
 from tetro_base import Tetromino, Cell
 
 SHAPE_CLASSES = cycle((O, I, J, L, S, Z, T))
 
+# Cell offsets (row, col) relative to a tetromino's start cell, keyed by
+# (shape class, rotation state, size). A shape only has 4 rotation
+# states, so the Cell geometry for each is computed once and every later
+# move test is a table lookup. _CELL_OFFSETS holds the current geometry,
+# _ROT_OFFSETS the geometry after one clockwise rotation.
+_CELL_OFFSETS = {}
+_ROT_OFFSETS = {}
+
 
 class World(Tetromino):
     """Represents the tetris world
@@ -32,14 +41,23 @@ class World(Tetromino):
     highest row in stack is 19"""
     def __init__(self, size=1, screen=None):
         super().__init__(size, screen)
-        self.screen = self.pen.getscreen()
+        self.screen.tracer(0, 0)
+        self._dirty = False
         self.stack = self.tetro = None
+        self._moves = {}
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
         self.game_active = True
         self.paused = False
         self.message_pen = None
+        self._tick_ms = 500
+        self._next_tick = None
+        # Pregenerate the random green/yellow pattern shown on game over
+        # so the recolor is two batched color passes, not 200 choices
+        self._over_cells = {"green": [], "yellow": []}
+        for i, color in enumerate(choices(("green", "yellow"), k=200)):
+            self._over_cells[color].append(divmod(i, 10))
         self.init_screen()
 
     def init_screen(self, **settings):
@@ -51,29 +69,51 @@ class World(Tetromino):
         self.pen.clear()
         self.cells.clear()
         self.start = None
-        self.draw(0, s, "#253525")
+        self.draw(0, 20*s, "#253525")
         if self.stack is None:
             self.stack = Stack(self)
         else:
             self.stack.reset()
         self.spawn()
         self.display_score()
+        self._dirty = False
+        self.screen.update()
 
     def draw(self, x, y, color=""):
-        """Draws the world, a 20x10 grid"""
-        for row in range(20):
-            for col in range(10):
-                super().draw(x, y, color)
-                x += self.size
-            x, y = 0, y+self.size
-        self.screen.update()
+        """Draws the world, a 20x10 grid
+        One filled rectangle for the whole board plus a grid overlay
+        (a handful of canvas items instead of 200 per-cell fills)"""
+        s = self.size
+        pen = self.pen
+        self.screen.tracer(0)
+        # Background: a single cell covering the whole board
+        board = Cell(s, color or self.color, pen,
+                     (x, y), (x + 10*s, y), (x + 10*s, y - 20*s), (x, y - 20*s))
+        board.draw()
+        # Grid overlay: 9 vertical + 19 horizontal lines
+        pen.pu()
+        pen.setheading(90)
+        for col in range(1, 10):
+            pen.goto(col*s, 0)
+            pen.pd()
+            pen.fd(20*s)
+            pen.pu()
+        pen.setheading(0)
+        for row in range(1, 20):
+            pen.goto(0, row*s)
+            pen.pd()
+            pen.fd(10*s)
+            pen.pu()
+        pen.setheading(0)
 
     def spawn(self):
         """create a new/active tetro"""
-        self.tetro = next(SHAPE_CLASSES)(self.size, self.screen)
+        t = self.tetro = next(SHAPE_CLASSES)(self.size, self.screen)
         x, y = 4*self.size, 22*self.size
-        self.tetro.draw(x, y)
-        self.screen.update()
+        t.draw(x, y)
+        # Bind the dispatch table once per tetro instead of per move call
+        self._moves = dict(down=t.down, right=t.right, left=t.left, rotate=t.rotate)
+        self._dirty = True
 
     def get_tetro(self):
         """Returns the current active tetromino"""
@@ -89,10 +129,12 @@ class World(Tetromino):
         if self.stack.game_over:
             return self.game_over()
 
-        t = self.tetro
-        option = dict(down=t.down, right=t.right, left=t.left, rotate=t.rotate)
-        if self.stack.ok_move(t, instr):
-            option.get(instr)()
+        if self.stack.ok_move(self.tetro, instr):
+            # The tetro flushes its own repaint; marking the world dirty
+            # here would update the canvas a second time per move
+            self._moves[instr]()
+        # Covers a spawn queued by absorption on a blocked "down"
+        self._flush()
 
     def hard_drop(self):
         """While ok, drop current tetro by a cell until it hits bottom or stack"""
@@ -105,30 +147,57 @@ class World(Tetromino):
         
         # One more move to trigger absorption
         self.move("down")
+        self._flush()
 
     def play(self):
         """Main game loop - automatically drops tetromino every cycle"""
         if not self.game_active or self.stack.game_over or self.paused:
+            self._next_tick = None
             return
-            
+
+        # Re-arm the timer before doing any work so the drop rate does not
+        # drift by the duration of move(); ontimer is a one-shot Tk after()
+        now = time.monotonic()
+        period = self._tick_ms / 1000
+        if self._next_tick is None or self._next_tick <= now:
+            self._next_tick = now + period
+        else:
+            self._next_tick += period
+        self.screen.ontimer(self.play, max(1, int((self._next_tick - now) * 1000)))
+
         self.move("down")
-        
-        # Calculate delay based on level (gets faster as level increases)
-        delay = max(100, 500 - (self.level - 1) * 50)
-        self.screen.ontimer(self.play, delay)
+        self._flush()
+
+    def _flush(self):
+        """Push pending drawing to the screen in a single update"""
+        if self._dirty:
+            self._dirty = False
+            self.screen.update()
 
     def game_over(self):
         """Simplest game over graphic I could think of
-        randomly reset cell colors to yellow or green and redraw"""
+        recolor the board with the pregenerated yellow/green pattern"""
         if not self.game_active:
             return
         self.game_active = False
-        colors = ("green", "yellow")
 
-        # Recolor background grid
-        for c in self.cells:
-            c.color = choice(colors)
-        self.redraw()
+        # Repaint the board grouped by color: one fillcolor change per
+        # color instead of one per cell
+        pen = self.pen
+        s = self.size
+        pen.clear()
+        pen.pu()
+        for color, cells in self._over_cells.items():
+            pen.fillcolor(color)
+            for row, col in cells:
+                x, y = col * s, row * s
+                pen.goto(x, y + s)
+                pen.pd()
+                pen.begin_fill()
+                for p in ((x + s, y + s), (x + s, y), (x, y), (x, y + s)):
+                    pen.goto(p)
+                pen.end_fill()
+                pen.pu()
 
         # Clear stacked blocks so the background pattern shows through
         if self.stack:
@@ -190,8 +259,10 @@ class World(Tetromino):
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
+        self._tick_ms = 500
         self.game_active = True
         self.paused = False
+        self._next_tick = None
         self.init_screen()
         # Restart automatic drop loop
         self.screen.ontimer(self.play, 500)
@@ -219,7 +290,7 @@ class World(Tetromino):
             # Resume gameplay loop
             if self.message_pen:
                 self.message_pen.clear()
-            self.screen.ontimer(self.play, max(100, 500 - (self.level - 1) * 50))
+            self.screen.ontimer(self.play, self._tick_ms)
         self.screen.update()
 
     def pause_game(self):
@@ -251,7 +322,7 @@ class World(Tetromino):
         if self.message_pen:
             self.message_pen.clear()
         # Resume gameplay loop
-        self.screen.ontimer(self.play, max(100, 500 - (self.level - 1) * 50))
+        self.screen.ontimer(self.play, self._tick_ms)
         self.screen.update()
     def update_score(self, lines):
         """Update score based on number of lines cleared
@@ -264,9 +335,10 @@ class World(Tetromino):
         self.score += points
         self.lines_cleared += lines
         
-        # Level up every 10 lines
+        # Level up every 10 lines; the drop delay only changes here
         self.level = (self.lines_cleared // 10) + 1
-        
+        self._tick_ms = max(100, 500 - (self.level - 1) * 50)
+
         self.display_score()
 
     def display_score(self):
@@ -294,59 +366,86 @@ class World(Tetromino):
 class Stack(Tetromino):
     def __init__(self, world: World):
         super().__init__(world.size, world.screen)
-        self.state_matrix = None
+        self.rows = None
         self.world = world
         self.game_over = False
+        # Struct-of-arrays cell storage: parallel lists of grid rows,
+        # grid columns and fill colors, one entry per landed cell
+        self.rows_arr = []
+        self.cols_arr = []
+        self.colors_arr = []
+        self._drawn_cells = 0
         self.init_state_matrix()
 
     def reset(self):
         """Clear stack state for a new game"""
         self.pen.clear()
-        self.cells.clear()
+        self.rows_arr.clear()
+        self.cols_arr.clear()
+        self.colors_arr.clear()
         self.init_state_matrix()
         self.game_over = False
+        self._drawn_cells = 0
 
     def init_state_matrix(self):
-        """Initializes stack state i.e.  20x10 table with 0's """
-        self.state_matrix = [[0 for _ in range(10)] for _ in range(20)]
-
-    def _rebuild_state_matrix(self):
-        """Recompute the occupancy grid from current cells"""
-        self.init_state_matrix()
-        overflow = False
-        max_row = -1
-        max_top = float("-inf")
-        for cell in self.cells:
-            xl, yl, xh, yh = cell.get_bounds()
-            row = int(yl // self.size)
-            col = int(xl // self.size)
-            max_row = max(max_row, row)
-            max_top = max(max_top, yh)
-            if row >= 20 or col < 0 or col >= 10:
-                overflow = True
-                continue
-            if 0 <= row < 20 and 0 <= col < 10:
-                self.state_matrix[row][col] = 1
-        if overflow or max_row >= 19 or max_top >= 20 * self.size:
-            self.game_over = True
+        """Initializes stack state: 20 row bitmasks, bit c set means
+        column c of that row is occupied. bitboard packs the same 200
+        bits into one int (row r occupies bits 10r..10r+9)
+        The rows list is allocated once and zeroed in place on restarts
+        so references to it stay valid and no garbage is created"""
+        if self.rows is None:
+            self.rows = [0] * 20
+        else:
+            for i in range(20):
+                self.rows[i] = 0
+        self.bitboard = 0
+
+    def _tetro_offsets(self, tetro: Tetromino):
+        """Cell (row, col) offsets of tetro relative to its start cell,
+        computed from the Cell geometry once per (shape, state, size)"""
+        sz = self.size
+        key = (type(tetro), tetro.state, sz)
+        offsets = _CELL_OFFSETS.get(key)
+        if offsets is None:
+            sx, sy = tetro.start
+            offs = []
+            for cell in tetro.cells:
+                xl, yl, xh, yh = cell.get_bounds()
+                offs.append((round((yl - sy) / sz), round((xl - sx) / sz)))
+            offsets = _CELL_OFFSETS[key] = tuple(offs)
+        return offsets
+
+    def _fill_square(self, row, col, color):
+        """Fill the grid square at (row, col) with the given color"""
+        sz = self.size
+        x, y = col * sz, row * sz
+        pen = self.pen
+        pen.pu()
+        pen.goto(x, y + sz)
+        pen.fillcolor(color)
+        pen.pd()
+        pen.begin_fill()
+        for p in ((x + sz, y + sz), (x + sz, y), (x, y), (x, y + sz)):
+            pen.goto(p)
+        pen.end_fill()
 
-    def _validate_cells(self, cells, *, absorb=False, tetro: Optional[Tetromino] = None, enforce_bottom=False) -> bool:
-        """Check whether proposed cells are in bounds and collision-free"""
-        for cell in cells:
-            xl, yl, xh, yh = cell.get_bounds()
-            if xl < 0 or xh > 10 * self.size:
-                return False
-            if enforce_bottom and yl < 0:
-                if absorb and tetro:
-                    self.absorb(tetro=tetro)
-                return False
-            row = int(yl // self.size)
-            col = int(xl // self.size)
-            if 0 <= row < 20 and 0 <= col < 10 and self.state_matrix[row][col]:
-                if absorb and tetro:
-                    self.absorb(tetro=tetro)
-                return False
-        return True
+    def redraw(self):
+        """Draw only the cells appended since the last repaint; cells
+        drawn earlier are still on the canvas untouched"""
+        rows_arr, cols_arr, colors_arr = self.rows_arr, self.cols_arr, self.colors_arr
+        for i in range(self._drawn_cells, len(rows_arr)):
+            self._fill_square(rows_arr[i], cols_arr[i], colors_arr[i])
+        self._drawn_cells = len(rows_arr)
+        self.update_screen()
+
+    def _redraw_full(self):
+        """Clear and repaint the whole stack in one batch; needed after
+        a line clear shifts surviving cells"""
+        self.pen.clear()
+        for row, col, color in zip(self.rows_arr, self.cols_arr, self.colors_arr):
+            self._fill_square(row, col, color)
+        self._drawn_cells = len(self.rows_arr)
+        self.update_screen()
 
     def ok_move(self, tetro: Tetromino, move="down") -> bool:
         """Given a Tetromino and intended move returns a boolean
@@ -360,41 +459,95 @@ class Stack(Tetromino):
             that return cells for proposed move from tetro
               Ex. for a right move check_overlap(*[c >> 1 for c in tetro.cells])
             without drawing or affecting the state of the world"""
-        if move == "down":
-            next_cells = [-c for c in tetro.cells]
-            return self._validate_cells(next_cells, absorb=True, tetro=tetro, enforce_bottom=True)
-
-        if move == "right":
-            next_cells = [c >> 1 for c in tetro.cells]
-            return self._validate_cells(next_cells)
+        sz = self.size
+        sx, sy = tetro.start
+        base_row = int(sy // sz)
+        base_col = int(sx // sz)
+        rows = self.rows
 
-        if move == "left":
-            next_cells = [c << 1 for c in tetro.cells]
-            return self._validate_cells(next_cells)
+        if move == "down":
+            row_masks = {}
+            for off_row, off_col in self._tetro_offsets(tetro):
+                row = base_row + off_row - 1
+                if row < 0:
+                    self.absorb(tetro=tetro)
+                    return False
+                if row < 20:
+                    row_masks[row] = row_masks.get(row, 0) | (1 << (base_col + off_col))
+            for row, mask in row_masks.items():
+                if rows[row] & mask:
+                    self.absorb(tetro=tetro)
+                    return False
+            return True
+
+        if move in ("right", "left"):
+            base_col += 1 if move == "right" else -1
+            row_masks = {}
+            for off_row, off_col in self._tetro_offsets(tetro):
+                col = base_col + off_col
+                if col < 0 or col >= 10:
+                    return False
+                row = base_row + off_row
+                if 0 <= row < 20:
+                    row_masks[row] = row_masks.get(row, 0) | (1 << col)
+            for row, mask in row_masks.items():
+                if rows[row] & mask:
+                    return False
+            return True
 
         if move == "rotate":
-            rotated_cells = [c * tetro.rot_center for c in tetro.cells]
-            return self._validate_cells(rotated_cells, enforce_bottom=True)
+            key = (type(tetro), tetro.state, sz)
+            offsets = _ROT_OFFSETS.get(key)
+            if offsets is None:
+                rotated_cells = [c * tetro.rot_center for c in tetro.cells]
+                offs = []
+                for c in rotated_cells:
+                    xl, yl, xh, yh = c.get_bounds()
+                    offs.append((round((yl - sy) / sz), round((xl - sx) / sz)))
+                offsets = _ROT_OFFSETS[key] = tuple(offs)
+            row_masks = {}
+            for off_row, off_col in offsets:
+                row = base_row + off_row
+                col = base_col + off_col
+                if col < 0 or col >= 10 or row < 0:
+                    return False
+                if row < 20:
+                    row_masks[row] = row_masks.get(row, 0) | (1 << col)
+            for row, mask in row_masks.items():
+                if rows[row] & mask:
+                    return False
+            return True
 
         return False
 
     def absorb(self, *cells, tetro: Tetromino = None):
         """Absorb tetromino into the stack and spawn new one"""
         if tetro:
-            # Clone tetromino cells so stack owns its drawing state
-            new_cells = [
-                Cell(self.size, cell.color, self.pen, *cell.points)
-                for cell in tetro.cells
-            ]
+            # Convert the tetromino's cells to grid coordinates once;
+            # the stack only ever stores (row, col, color) triples
+            sz = self.size
+            rows = self.rows
+            touched = set()
+            for cell in tetro.cells:
+                xl, yl, xh, yh = cell.get_bounds()
+                row = int(yl // sz)
+                col = int(xl // sz)
+                if row >= 19 or col < 0 or col >= 10:
+                    self.game_over = True
+                if 0 <= row < 20 and 0 <= col < 10:
+                    rows[row] |= 1 << col
+                    self.bitboard |= 1 << (10 * row + col)
+                    touched.add(row)
+                self.rows_arr.append(row)
+                self.cols_arr.append(col)
+                self.colors_arr.append(cell.color)
             tetro.pen.clear()
             tetro.cells.clear()
-
-            self.cells.extend(new_cells)
-            self._rebuild_state_matrix()
             self.redraw()
 
-            # Check for completed lines and rearrange
-            self.rearrange()
+            # Check for completed lines and rearrange; only the rows the
+            # new piece landed in can have filled up
+            self.rearrange(touched)
 
             # Check for game over condition or spawn next tetromino
             self.request_tetro()
@@ -407,47 +560,58 @@ class Stack(Tetromino):
             return
 
         # Check if any cells occupy the top visible row
-        for col in range(10):
-            if self.state_matrix[19][col] == 1:
-                self.game_over = True
-                self.world.game_over()
-                return
+        if self.bitboard >> 190:
+            self.game_over = True
+            self.world.game_over()
+            return
 
         # Spawn new tetromino
         self.world.spawn()
 
-    def rearrange(self):
+    def rearrange(self, touched_rows=None):
         """Rearrange stack after absorbing a tetro
             - Find row index of full lines i.e. all cells no zeros
             - Clear out full lines
             - Drop lines above each deleted line (starting from the top)
+        Only touched_rows (the rows the absorbed piece landed in) can
+        have become full; scanning all 20 rows is the fallback.
         """
-        lines_to_clear = [row for row in range(20) if all(self.state_matrix[row])]
+        candidates = touched_rows if touched_rows is not None else range(20)
+        lines_to_clear = [row for row in candidates if self.rows[row] == 0x3FF]
         if not lines_to_clear:
             return
 
         lines_to_clear.sort()
         cleared_set = set(lines_to_clear)
-        updated_cells = []
-        for cell in self.cells:
-            xl, yl, xh, yh = cell.get_bounds()
-            row = int(yl // self.size)
-            if row in cleared_set:
+        # Cleared lines sit in a narrow band near the bottom; the range
+        # check short-circuits the set lookup for most surviving cells
+        lo, hi = lines_to_clear[0], lines_to_clear[-1]
+        new_rows, new_cols, new_colors = [], [], []
+        for row, col, color in zip(self.rows_arr, self.cols_arr, self.colors_arr):
+            if lo <= row <= hi and row in cleared_set:
                 continue
-            drop = sum(1 for cleared in lines_to_clear if cleared < row)
-            if drop:
-                cell.translate_y(-drop)
-            updated_cells.append(cell)
-
-        self.cells = updated_cells
-        self._rebuild_state_matrix()
+            drop = bisect_left(lines_to_clear, row)
+            new_rows.append(row - drop)
+            new_cols.append(col)
+            new_colors.append(color)
+
+        self.rows_arr, self.cols_arr, self.colors_arr = new_rows, new_cols, new_colors
+        # Shift surviving rows down and refill the top with empty rows
+        # (row 0 is the bottom of the board)
+        k = len(lines_to_clear)
+        self.rows[:] = ([mask for i, mask in enumerate(self.rows) if i not in cleared_set]
+                        + [0] * k)
+        self.bitboard = sum(mask << (10 * r) for r, mask in enumerate(self.rows))
         self.world.update_score(len(lines_to_clear))
-        self.redraw()
+        self._redraw_full()
 
 
 if __name__ == '__main__':
     tt.ht()
-    tt.tracer(10000)
+    # Disable animation entirely; every frame is flushed manually with
+    # a single screen.update()
+    tt.tracer(0, 0)
+    tt.delay(0)
     w = World()
 
     scr = tt.getscreen()
@@ -15,7 +15,13 @@ Project:
 import turtle as tt
 from collections.abc import Sequence
 from random import randint
-from math import sin, cos, pi
+
+from tetro_kernels import rotate_cw, translate
+
+# Cell geometries for the 4 rotation states of each shape class, as
+# points relative to the shape's start corner, keyed by (class, size).
+# Built lazily from the live Cell math on a shape's first rotation.
+_ROT_STATES = {}
 
 
 class Cell:
@@ -40,42 +46,86 @@ class Cell:
             __repr__(): Returns a string representation of the cell.
     """
 
+    __slots__ = ('size', 'color', 'pen', 'gpoints', 'state', '_key', '_wpoints')
+
     def __init__(self, size, color, pen, *points, state=0):
-        assert len(points) == 4, "Number of points must be 4"
-        assert points[0] != points[1] != points[2] != points[3], "There can't be duplicates in cell corners"
-        self.points = list(points)
         self.color = color
         self.pen = pen
         self.size = size
         self.state = state
+        # Geometry is kept in grid units (corner coords divided by
+        # size); world coordinates are derived lazily for drawing, so
+        # translations are plain +-1 adds with no multiplies
+        self.gpoints = [(int(x // size), int(y // size)) for x, y in points]
+        self._wpoints = None
+        self._refresh_key()
+
+    @classmethod
+    def from_grid(cls, size, color, pen, gpoints, state=0):
+        """Trusted constructor for the hot paths: takes grid corners
+        directly and skips the world-to-grid conversion"""
+        cell = cls.__new__(cls)
+        cell.color = color
+        cell.pen = pen
+        cell.size = size
+        cell.state = state
+        cell.gpoints = gpoints
+        cell._wpoints = None
+        cell._refresh_key()
+        return cell
+
+    @property
+    def points(self):
+        """World-coordinate corners, derived lazily from grid coords"""
+        if self._wpoints is None:
+            s = self.size
+            self._wpoints = [(i * s, j * s) for i, j in self.gpoints]
+        return self._wpoints
+
+    @points.setter
+    def points(self, points):
+        s = self.size
+        self.gpoints = [(int(x // s), int(y // s)) for x, y in points]
+        self._wpoints = None
+        self._refresh_key()
+
+    def _refresh_key(self):
+        """Cache the order-insensitive identity of the grid corners;
+        equality and hashing compare this one tuple instead of building
+        fresh sets per comparison"""
+        self._key = tuple(sorted(self.gpoints))
 
     def draw(self):
         """Turtle visits each point in self.points to draw cell
         >>> c = Cell(1, "red", tt.RawTurtle(tt.getscreen()), (-1, 1), (1, 1), (1, -1), (-1, -1))
         """
+        points = self.points
         self.pen.pu()
-        self.pen.goto(self.points[0])
+        self.pen.goto(points[0])
         self.pen.fillcolor(self.color)
         self.pen.pd()
         self.pen.begin_fill()
-        for p in self.points + [self.points[0]]:
+        for p in points:
             self.pen.goto(p)
+        self.pen.goto(points[0])
         self.pen.end_fill()
 
     def rotate(self, xc, yc):
         """Rotates each point by 90 degrees clockwise or -pi/2
-        rotation formula for point (x, y) around center (xc, yc) is given by
-               x' = xc + (x-xc)*cos(-pi/2) - (y-yc)*sin(-pi/2)
-               y' = yc + (x-xc)*sin(-pi/2) + (y-yc)*cos(-pi/2)
+        the rotation matrix for -pi/2 collapses to [[0, 1], [-1, 0]], so
+        a point (x, y) around center (xc, yc) maps to
+               x' = xc + (y-yc)
+               y' = yc - (x-xc)
         :tests:
         >>> c = Cell(1, "red", tt.RawTurtle(tt.getscreen()), (-1, 1), (1, 1), (1, -1), (-1, -1))
         >>> c.rotate(0, 0)
         >>> c.points
         [(1, 1), (1, -1), (-1, -1), (-1, 1)]
         """
-        self.points = [( round(xc + (x-xc)*cos(-pi/2) - (y-yc)*sin(-pi/2)),
-                         round(yc + (x-xc)*sin(-pi/2) + (y-yc)*cos(-pi/2)) )
-                            for x, y in self.points]
+        s = self.size
+        self.gpoints = rotate_cw(self.gpoints, xc / s, yc / s)
+        self._wpoints = None
+        self._refresh_key()
 
     def translate_x(self, factor=1):
         """Move in x plane by factor times cell size
@@ -86,7 +136,9 @@ class Cell:
         >>> c.points
         [(0, 1), (2, 1), (2, -1), (0, -1)]
         """
-        self.points = [(x+factor*self.size, y) for x, y in self.points]
+        self.gpoints = translate(self.gpoints, factor, 0)
+        self._wpoints = None
+        self._refresh_key()
 
     def translate_y(self, factor=1):
         """Move in x plane by factor times cell size
@@ -97,45 +149,43 @@ class Cell:
         >>> c.points
         [(-1, 2), (1, 2), (1, 0), (-1, 0)]
         """
-        self.points = [(x, y+factor*self.size) for x, y in self.points]
+        self.gpoints = translate(self.gpoints, 0, factor)
+        self._wpoints = None
+        self._refresh_key()
 
     def get_bounds(self):
         """Returns 4 tuple lowest point (i.e. bottom left corner) xl, yl
         and highest point (i.e. upper left corner) xh, yh of shape"""
-        xl, xh = sorted(set(x for x, y in self.points))
-        yl, yh = sorted(set(y for x, y in self.points))
-        return xl, yl, xh, yh
+        s = self.size
+        xs = [i for i, j in self.gpoints]
+        ys = [j for i, j in self.gpoints]
+        return min(xs) * s, min(ys) * s, max(xs) * s, max(ys) * s
 
     def __neg__(self):
         """-Cell() -> returns a new Cell dropped by 1 unit from the original
         i.e. y-size for all y"""
-        points = [(x, y-self.size) for x, y in self.points]
-        s, c, p = self.size, self.color, self.pen
-        return Cell(s, c, p, *points)
+        return Cell.from_grid(self.size, self.color, self.pen,
+                              translate(self.gpoints, 0, -1))
 
     def __rshift__(self, factor:int):
         """Cell() >> 1 -> returns a new Cell shifted right by 1 unit from the original
             i.e. x+size for all x"""
-        points = [(x+factor*self.size, y) for x, y in self.points]
-        s, c, p = self.size, self.color, self.pen
-        return Cell(s, c, p, *points)
+        return Cell.from_grid(self.size, self.color, self.pen,
+                              translate(self.gpoints, factor, 0))
 
     def __lshift__(self, factor:int):
         """Cell() << 1 -> returns a new Cell shifted left by 1 unit from the original
                     i.e. x-size for all x"""
-        points = [(x-factor*self.size, y) for x, y in self.points]
-        s, c, p = self.size, self.color, self.pen
-        return Cell(s, c, p, *points)
+        return Cell.from_grid(self.size, self.color, self.pen,
+                              translate(self.gpoints, -factor, 0))
 
     def __mul__(self, point: Sequence[float, float]):
         """Cell() * (0, 0) -> returns a new Cell rotated clockwise 90 about (0, 0)
               from the original"""
         xc, yc = point
-        points = [(round(xc + (x-xc) * cos(-pi/2) - (y - yc) * sin(-pi/2)),
-                   round(yc + (x-xc) * sin(-pi/2) + (y - yc) * cos(-pi/2)))
-                  for x, y in self.points]
-        s, c, p = self.size, self.color, self.pen
-        return Cell(s, c, p, *points)
+        s = self.size
+        return Cell.from_grid(s, self.color, self.pen,
+                              rotate_cw(self.gpoints, xc / s, yc / s))
 
     def __eq__(self, other):
         """Two Cells are equivalent/overlapping if all their points are the same
@@ -146,11 +196,14 @@ class Cell:
         True
         """
         if not isinstance(other, Cell): return NotImplemented
-        return set(self.points) == set(other.points)
+        return self._key == other._key
 
     def __ne__(self, other):
         return not self == other
 
+    def __hash__(self):
+        return hash(self._key)
+
     def __str__(self):
         """Returns Class name and bounds i.e. bottom left and
         upper left corner of cell"""
@@ -169,16 +222,40 @@ class Tetromino:
     (20, 0)
     """
     rot_offsets = ((0, 0, 0, 0), ) * 4
+    # Rotational bounds/center as multiples of size relative to start;
+    # shape classes override these instead of update_bounds itself
+    _bounds_mults = None
+    _center_mults = None
+    # Cell positions as multiples of size relative to start; shape
+    # classes declare these instead of overriding draw
+    _cell_offsets = None
+    default_color = "white"
+    # Fixed attribute layout; a game allocates a tetromino per spawn.
+    # Subclasses that need ad-hoc attributes (World, Stack) simply don't
+    # declare __slots__ and get their instance dict back.
+    __slots__ = ('__size', '_scaled_offsets', 'start', 'rot_center',
+                 'rot_bounds', 'color', 'cells', '_cellset', 'state',
+                 'pen', 'screen')
 
     def __init__(self, size=20, screen=None):
         self.__size = size
+        # rot_offsets scaled to pixels once; get_actual_bounds only adds
+        self._scaled_offsets = tuple(tuple(o * size for o in offs)
+                                     for offs in self.rot_offsets)
         self.start = None
         self.rot_center = (0, 0)
         self.rot_bounds = None
-        self.color = "white"
+        self.color = self.default_color
         self.cells = []
+        self._cellset = set()
         self.state = 0
         self.pen = tt.RawTurtle(screen or tt.getscreen(), visible=False)
+        # Cache the screen handle; getscreen() walks turtle internals on
+        # every call and the screen never changes for a pen's lifetime
+        self.screen = self.pen.getscreen()
+        # Draw in direct mode: nothing is painted until update_screen()
+        # flushes, so a move's clear + redraw lands as one frame
+        self.screen.tracer(0)
 
     @property
     def size(self):
@@ -187,6 +264,8 @@ class Tetromino:
     @size.setter
     def size(self, value):
         self.__size = value
+        self._scaled_offsets = tuple(tuple(o * value for o in offs)
+                                     for offs in self.rot_offsets)
 
     def draw(self, x, y, color=""):
         """Method for initial drawing of a basic Tetromino Cell requires a drawing starting
@@ -205,20 +284,43 @@ class Tetromino:
         >>> t.cells
         [Cell(0, -20, 20, 0)]
         """
+        if self._cell_offsets is not None:
+            # Shape classes: lay the cells out from the class-level
+            # offset table in one pass
+            self.start = (x, y)
+            self.cells.clear()
+            self._cellset.clear()
+            self.pen.clear()
+            color = color or self.color
+            s = self.size
+            for dx, dy in self._cell_offsets:
+                self._draw_cell(x + dx*s, y + dy*s, color)
+            self.update_bounds()
+            return
+        self._draw_cell(x, y, color)
+        # Single-cell draws are interactive (demo click-drawing); with
+        # the screen in tracer(0) mode nothing shows without a flush
+        self.update_screen()
+
+    def _draw_cell(self, x, y, color=""):
+        """Draw one cell of the shape at (x, y) and record it"""
         self.start = self.start or (x, y)
         self.color = color or self.color
+        # The four corners are known analytically; no need to step the
+        # pen and query pos() for each one
+        s = self.size
+        x, y = round(x), round(y)
+        points = [(x+s, y), (x+s, y-s), (x, y-s), (x, y)]
         self.pen.pu()
         self.pen.goto(x, y)
         self.pen.fillcolor(self.color)
         self.pen.pd()
         self.pen.begin_fill()
-        points = []
-        for _ in range(4):
-            self.pen.fd(self.size)
-            self.pen.right(90)
-            x, y = [round(p) for p in self.pen.pos()]
-            points.append((x,y))
-        self.cells.append(Cell(self.size, color, self.pen, *points))
+        for p in points:
+            self.pen.goto(p)
+        cell = Cell(s, color, self.pen, *points)
+        self.cells.append(cell)
+        self._cellset.add(cell._key)
         self.pen.end_fill()
 
     def draw_bounds(self):
@@ -231,8 +333,9 @@ class Tetromino:
             self.pen.pu()
             self.pen.goto(points[0])
             self.pen.pd()
-            for p in points + [points[0]]:
+            for p in points:
                 self.pen.goto(p)
+            self.pen.goto(points[0])
             self.update_screen()
 
     def redraw(self):
@@ -240,19 +343,54 @@ class Tetromino:
         ex. rotation, translation where cell points are changed"""
         self.pen.clear()
         self.update_bounds()
-        for cell in self.cells:
-            cell.draw()
+        self.draw_all_cells()
         self.update_screen()
 
+    def draw_all_cells(self):
+        """Draw every cell with the pen configured once.
+        Cells of a tetromino share one color, so fillcolor is set a
+        single time and each square gets its own small fill; mixed-color
+        cells fall back to per-cell draws.
+        Each square must be its own begin_fill/end_fill: turtle records
+        every goto in the fill path even pen-up, and begin_fill seeds
+        the path with the pen's current position, so one batch over all
+        squares becomes a self-intersecting polygon that Tk's even-odd
+        rule fills with holes"""
+        if not self.cells:
+            return
+        color = self.cells[0].color
+        if any(cell.color != color for cell in self.cells):
+            for cell in self.cells:
+                cell.draw()
+            return
+        pen = self.pen
+        pen.pu()
+        pen.fillcolor(color)
+        for cell in self.cells:
+            points = cell.points
+            pen.goto(points[0])
+            pen.pd()
+            pen.begin_fill()
+            for p in points[1:]:
+                pen.goto(p)
+            pen.goto(points[0])
+            pen.end_fill()
+            pen.pu()
+
     def right(self, factor:int=1):
         """Move right by given number of steps"""
         if self.cells:
             x, y = self.start
-            self.start = x + factor * self.size, y
-            self.update_bounds()
+            dx = factor * self.size
+            self.start = x + dx, y
+            # Shift every corner of every cell in one pass instead of
+            # dispatching translate_x per cell; grid units, no multiply
             for cell in self.cells:
-                cell.translate_x(factor)
-            self.redraw()
+                cell.gpoints = translate(cell.gpoints, factor, 0)
+                cell._wpoints = None
+                cell._refresh_key()
+            self._cellset = {cell._key for cell in self.cells}
+            self._shift_drawing(dx, 0)
 
     def left(self, factor:int=1):
         """Move left by given number of steps"""
@@ -261,34 +399,95 @@ class Tetromino:
     def up(self, factor:int=1):
         """Ascend/Climb by a step of 1"""
         x, y = self.start
-        self.start = x, y + factor*self.size
+        dy = factor * self.size
+        self.start = x, y + dy
         for cell in self.cells:
-            cell.translate_y(factor)
-        self.redraw()
+            cell.gpoints = translate(cell.gpoints, 0, factor)
+            cell._wpoints = None
+            cell._refresh_key()
+        self._cellset = {cell._key for cell in self.cells}
+        self._shift_drawing(0, dy)
 
     def down(self, factor:int=1):
         """Descend/Drop by step of 1"""
         self.up(-factor)
 
+    def _shift_drawing(self, dx, dy):
+        """Translate this pen's existing canvas items by (dx, dy) world
+        units. Moving items is far cheaper than the clear-and-redraw a
+        rotation needs, and pure translations don't change the shape"""
+        pen = self.pen
+        if not pen.items:
+            return self.redraw()
+        self.update_bounds()
+        screen = self.screen
+        cv = screen.cv
+        pdx, pdy = dx * screen.xscale, -dy * screen.yscale
+        for item in pen.items:
+            cv.move(item, pdx, pdy)
+        self.update_screen()
+
+    def _build_rot_states(self):
+        """Generate all 4 rotation states of this shape as start-relative
+        grid point lists by applying the rotation kernel three times to
+        the current geometry. Valid for shapes whose rot_center tracks
+        start"""
+        s = self.size
+        sx, sy = self.start
+        sgx, sgy = int(sx // s), int(sy // s)
+        xc, yc = self.rot_center
+        rxc, ryc = (xc - sx) / s, (yc - sy) / s
+        states = [None] * 4
+        rel = [[(gx - sgx, gy - sgy) for gx, gy in cell.gpoints]
+               for cell in self.cells]
+        state = self.state
+        states[state] = rel
+        for _ in range(3):
+            rel = [rotate_cw(pts, rxc, ryc) for pts in rel]
+            state = (state + 1) % 4
+            states[state] = rel
+        return states
+
     def rotate(self):
         """Rotate clockwise by 90 around shapes' rotation center
         invokes change_state after rotation
+        Shapes with known rotational bounds look the new geometry up in
+        a per-class table of the 4 precomputed states; the rotation math
+        itself then never runs again for that class
         Ref: https://tetris.wiki/Super_Rotation_System"""
+        if self.rot_bounds and self.cells:
+            key = (type(self), self.size)
+            states = _ROT_STATES.get(key)
+            if states is None:
+                states = _ROT_STATES[key] = self._build_rot_states()
+            self.change_state()
+            s = self.size
+            sx, sy = self.start
+            sgx, sgy = int(sx // s), int(sy // s)
+            for cell, rel in zip(self.cells, states[self.state]):
+                cell.gpoints = translate(rel, sgx, sgy)
+                cell._wpoints = None
+                cell._refresh_key()
+            self._cellset = {cell._key for cell in self.cells}
+            self.redraw()
+            return
         for c in self.cells:
             c.rotate(*self.rot_center)
+        self._cellset = {cell._key for cell in self.cells}
         self.redraw()
         self.change_state()
 
     def check_overlap(self, *cells: Cell, other:"Tetromino"=None):
         """TODO CX:
         Checks given cells or cells of a given Tetromino for overlap
-        Useful with moves to avoid moving into occupied cells"""
+        Useful with moves to avoid moving into occupied cells
+        A set intersection over cached cell keys replaces the old
+        nested per-cell equality loop"""
         cells = other.cells if other else cells
-        for other_cell in cells:
-            for my_cell in self.cells:
-                if other_cell == my_cell:
-                    return True
-        return False
+        if len(self._cellset) != len(self.cells):
+            # cells was mutated directly (e.g. cleared); resync
+            self._cellset = {cell._key for cell in self.cells}
+        return not self._cellset.isdisjoint(cell._key for cell in cells)
 
     def change_state(self):
         """TODO CX:
@@ -304,18 +503,28 @@ class Tetromino:
         We store offsets from rotational bounds on shapes where this applies
         """
         if self.rot_bounds:
-            offsets = self.rot_offsets[state or self.state]
+            offsets = self._scaled_offsets[state or self.state]
             bounds = self.rot_bounds
-            return [l+o*self.size for l, o in zip(bounds, offsets)]
+            return [l+o for l, o in zip(bounds, offsets)]
 
     def update_bounds(self):
         """TODO CX
         Updates rotation bounds (i.e. self.rot_bounds) wrt Tetromino's top left corner
         (i.e. self.start) and sets the shapes rotation center (i.e. self.rot_center).
         Must be invoked with every move/redraw of a Tetromino
+        Both are linear in start, so shape classes only declare the
+        per-class multipliers (_bounds_mults/_center_mults)
         Ref: https://tetris.wiki/Super_Rotation_System
         """
-        self.rot_center = (0, 0)
+        if self._bounds_mults is None:
+            self.rot_center = (0, 0)
+            return
+        x, y = self.start
+        s = self.size
+        mxl, myl, mxh, myh = self._bounds_mults
+        self.rot_bounds = x + mxl*s, y + myl*s, x + mxh*s, y + myh*s
+        cx, cy = self._center_mults
+        self.rot_center = x + cx*s, y + cy*s
 
     def clear(self):
         """Helper to clear pen drawings on screen"""
@@ -323,7 +532,7 @@ class Tetromino:
 
     def update_screen(self):
         """Helper method to update pen drawings on screen"""
-        self.pen.getscreen().update()
+        self.screen.update()
 
 
 def draw(x, y):
@@ -332,10 +541,14 @@ def draw(x, y):
     tetro.draw(x, y, colr)
 
 
+# Key-event dispatch bound once; avoids a .lower() + getattr per keypress
+_MOVES = {"Left": Tetromino.left, "Right": Tetromino.right,
+          "Up": Tetromino.up, "Down": Tetromino.down,
+          "space": Tetromino.rotate}
+
+
 def move_tetro(key):
-    global tetro
-    key = "rotate" if key == "space" else key
-    getattr(tetro, key.lower())()
+    _MOVES[key](tetro)
     tetro.draw_bounds()
 
 
@@ -0,0 +1,34 @@
+"""Geometry kernels for the tetris building blocks.
+
+The rotation and translation math lives here as module-level functions
+over plain data (lists of (x, y) tuples) with no object state, so the
+hot paths pay no method dispatch and the kernels could be swapped for
+compiled implementations without touching their callers.
+
+Project:
+    - tetris_230fall25,
+    - Author(s): Amissah
+"""
+
+
+def rotate_cw(points, xc, yc):
+    """Rotate points 90 degrees clockwise around (xc, yc)
+    the -pi/2 rotation matrix collapses to [[0, 1], [-1, 0]]
+    :tests:
+    >>> rotate_cw([(-1, 1), (1, 1), (1, -1), (-1, -1)], 0, 0)
+    [(1, 1), (1, -1), (-1, -1), (-1, 1)]
+    """
+    return [(int(xc + (y - yc)), int(yc - (x - xc))) for x, y in points]
+
+
+def translate(points, dx, dy):
+    """Shift points by (dx, dy)
+    :tests:
+    >>> translate([(0, 0), (1, 0)], 2, -1)
+    [(2, -1), (3, -1)]
+    """
+    if dy == 0:
+        return [(x + dx, y) for x, y in points]
+    if dx == 0:
+        return [(x, y + dy) for x, y in points]
+    return [(x + dx, y + dy) for x, y in points]
@@ -1,7 +1,7 @@
 """Provides Tetromino shape classes for a Tetris game implementation.
 This module defines the different Tetromino shapes (O, I, Z, S, T, L, J) used in Tetris.
-Each shape class inherits from the base Tetromino class and implements specific drawing
-and rotation behavior.
+Each shape class inherits from the base Tetromino class and declares its cell layout,
+color and rotation behavior as class-level data.
 Classes:
     - O: Square shaped tetromino (yellow)
     - I: Long straight tetromino (light blue)
@@ -32,195 +32,108 @@ LJSZT_Offsets = ((0, 1, 0, 0),
 
 
 class O(Tetromino):
+    """:tests:
+    >>> o = O()  # default size is 20
+    >>> o.draw(0, 0)
+    >>> o.rot_bounds
+    (-20, -60, 60, 0)
+    """
     rot_offsets = ((1, 1, -1, 0), ) * 4
-
-    def draw(self, x, y, color="yellow"):
-        """:tests:
-        >>> o = O()  # default size is 20
-        >>> o.draw(0, 0)
-        >>> o.rot_bounds
-        (-20, -60, 60, 0)
-        """
-        self.start = (x, y)
-        self.cells.clear()
-        self.pen.clear()
-        for _ in range(2):
-            for _ in range(2):
-                super().draw(x, y, color)
-                x += self.size
-            y -= self.size
-            x -= self.size * 2
-        self.update_bounds()
-
-    def update_bounds(self):
-        x, y = self.start
-        s = self.size
-        self.rot_bounds = x-s, y-s*3, x+s*3, y
-        self.rot_center = x+s, y-s
+    _bounds_mults = (-1, -3, 3, 0)
+    _center_mults = (1, -1)
+    _cell_offsets = ((0, 0), (1, 0), (0, -1), (1, -1))
+    default_color = "yellow"
+    __slots__ = ()
 
 
 class I(Tetromino):
+    """:tests:
+    >>> i = I()  # default size is 20
+    >>> i.draw(0, 0)
+    >>> i.rot_bounds
+    (0, -60, 80, 20)
+    """
     rot_offsets = (0, 2, 0, -1), (2, 0, -1, 0), (0, 1, 0, -2), (1, 0, -2, 0)
-
-    def draw(self, x, y, color="lightblue"):
-        """:tests:
-        >>> i = I()  # default size is 20
-        >>> i.draw(0, 0)
-        >>> i.rot_bounds
-        (0, -60, 80, 20)
-        """
-        self.start = (x, y)
-        self.cells.clear()
-        self.pen.clear()
-        for _ in range(4):
-            super().draw(x, y, color)
-            x += self.size
-        self.update_bounds()
-
-    def update_bounds(self):
-        x, y = self.start
-        s = self.size
-        self.rot_bounds = xl, yl, xh, yh = x, y-s*3, x+s*4, y+s
-        self.rot_center = (xl+xh)/2, (yl+yh)/2
+    _bounds_mults = (0, -3, 4, 1)
+    _center_mults = (2, -1)
+    _cell_offsets = ((0, 0), (1, 0), (2, 0), (3, 0))
+    default_color = "lightblue"
+    __slots__ = ()
 
 
 class Z(Tetromino):
+    """:tests:
+    >>> z = Z()
+    >>> z.draw(0, 0)
+    >>> z.rot_bounds
+    (0, -60, 60, 0)
+    """
     rot_offsets = LJSZT_Offsets
-
-    def draw(self, x, y, color="red"):
-        """:tests:
-        >>> z = Z()
-        >>> z.draw(0, 0)
-        >>> z.rot_bounds
-        (0, -60, 60, 0)
-        """
-        self.start = (x, y)
-        self.cells.clear()
-        self.pen.clear()
-        for _ in range(2):
-            for _ in range(2):
-                super().draw(x, y, color)
-                x += self.size
-            y -= self.size
-            x -= self.size
-        self.update_bounds()
-
-    def update_bounds(self):
-        x, y = self.start
-        s = self.size
-        self.rot_bounds = xl, yl, xh, yh = x, y-s*3, x+s*3, y
-        self.rot_center = (xl+xh)/2, (yl+yh)/2
+    _bounds_mults = (0, -3, 3, 0)
+    _center_mults = (1.5, -1.5)
+    _cell_offsets = ((0, 0), (1, 0), (1, -1), (2, -1))
+    default_color = "red"
+    __slots__ = ()
 
 
 class S(Tetromino):
+    """:tests:
+    >>> s = S()
+    >>> s.draw(0, 0)
+    >>> s.rot_bounds
+    (-20, -60, 40, 0)
+    """
     rot_offsets = LJSZT_Offsets
-
-    def draw(self, x, y, color="green"):
-        """:tests:
-        >>> s = S()
-        >>> s.draw(0, 0)
-        >>> s.rot_bounds
-        (-20, -60, 40, 0)
-        """
-        self.start = (x, y)
-        self.cells.clear()
-        self.pen.clear()
-        for _ in range(2):
-            for _ in range(2):
-                super().draw(x, y, color)
-                x += self.size
-            y -= self.size
-            x -= self.size * 3
-        self.update_bounds()
-
-    def update_bounds(self):
-        x, y = self.start
-        s = self.size
-        self.rot_bounds = xl, yl, xh, yh = x-s, y-s*3, x+s*2, y
-        self.rot_center = (xl+xh)/2, (yl+yh)/2
+    _bounds_mults = (-1, -3, 2, 0)
+    _center_mults = (0.5, -1.5)
+    _cell_offsets = ((0, 0), (1, 0), (-1, -1), (0, -1))
+    default_color = "green"
+    __slots__ = ()
 
 
 class T(Tetromino):
+    """:tests:
+    >>> t = T()
+    >>> t.draw(0, 0)
+    >>> t.rot_bounds
+    (-20, -60, 40, 0)
+    """
     rot_offsets = LJSZT_Offsets
-
-    def draw(self, x, y, color="purple"):
-        """:tests:
-        >>> t = T()
-        >>> t.draw(0, 0)
-        >>> t.rot_bounds
-        (-20, -60, 40, 0)
-        """
-        self.start = (x, y)
-        self.cells.clear()
-        self.pen.clear()
-        super().draw(x, y, color)
-        x -= self.size
-        y -= self.size
-        for _ in range(3):
-            super().draw(x, y, color)
-            x += self.size
-        self.update_bounds()
-
-    def update_bounds(self):
-        x, y = self.start
-        s = self.size
-        self.rot_bounds = xl, yl, xh, yh = x-s, y-s*3, x+s*2, y
-        self.rot_center = (xl+xh)/2, (yl+yh)/2
+    _bounds_mults = (-1, -3, 2, 0)
+    _center_mults = (0.5, -1.5)
+    _cell_offsets = ((0, 0), (-1, -1), (0, -1), (1, -1))
+    default_color = "purple"
+    __slots__ = ()
 
 
 class L(Tetromino):
+    """:tests:
+    >>> l = L()
+    >>> l.draw(0, 0)
+    >>> l.rot_bounds
+    (-40, -60, 20, 0)
+    """
     rot_offsets = LJSZT_Offsets
-
-    def draw(self, x, y, color="orange"):
-        """:tests:
-        >>> l = L()
-        >>> l.draw(0, 0)
-        >>> l.rot_bounds
-        (-40, -60, 20, 0)
-        """
-        self.start = (x, y)
-        self.cells.clear()
-        self.pen.clear()
-        super().draw(x, y, color)
-        x -= self.size * 2
-        y -= self.size
-        for _ in range(3):
-            super().draw(x, y, color)
-            x += self.size
-        self.update_bounds()
-
-    def update_bounds(self):
-        x, y = self.start
-        s = self.size
-        self.rot_bounds = xl, yl, xh, yh = x-s*2, y-s*3, x+s, y
-        self.rot_center = (xl + xh)/2, (yl + yh)/2
+    _bounds_mults = (-2, -3, 1, 0)
+    _center_mults = (-0.5, -1.5)
+    _cell_offsets = ((0, 0), (-2, -1), (-1, -1), (0, -1))
+    default_color = "orange"
+    __slots__ = ()
 
 
 class J(Tetromino):
+    """:tests:
+    >>> j = J()
+    >>> j.draw(0, 0)
+    >>> j.rot_bounds
+    (0, -60, 60, 0)
+    """
     rot_offsets = LJSZT_Offsets
-
-    def draw(self, x, y, color="blue"):
-        """:tests:
-        >>> j = J()
-        >>> j.draw(0, 0)
-        >>> j.rot_bounds
-        (0, -60, 60, 0)
-        """
-        self.start = (x, y)
-        self.cells.clear()
-        self.pen.clear()
-        super().draw(x, y, color)
-        y -= self.size
-        for _ in range(3):
-            super().draw(x, y, color)
-            x += self.size
-        self.update_bounds()
-
-    def update_bounds(self):
-        x, y = self.start
-        s = self.size
-        self.rot_bounds = xl, yl, xh, yh = x, y-s*3, x+s*3, y
-        self.rot_center = (xl + xh)/2, (yl + yh)/2
+    _bounds_mults = (0, -3, 3, 0)
+    _center_mults = (1.5, -1.5)
+    _cell_offsets = ((0, 0), (0, -1), (1, -1), (2, -1))
+    default_color = "blue"
+    __slots__ = ()
 
 
 def change_tetro(x, y):
@@ -235,10 +148,14 @@ def change_tetro(x, y):
     tt.update()
 
 
+# Key-event dispatch bound once; avoids a .lower() + getattr per keypress
+_MOVES = {"Left": Tetromino.left, "Right": Tetromino.right,
+          "Up": Tetromino.up, "Down": Tetromino.down,
+          "space": Tetromino.rotate}
+
+
 def move_tetro(key):
-    global tetro
-    key = "rotate" if key == "space" else key
-    getattr(tetro, key.lower())()
+    _MOVES[key](tetro)
     tetro.draw_bounds()
 
 